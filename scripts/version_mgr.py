@@ -16,12 +16,16 @@ import json
 import argparse
 import urllib.request
 import os
-import tempfile
+import shutil
+import threading
+from concurrent.futures import Future
 
 from git import Git
 from datetime import datetime
 
 VERSIONS_FILE = "versions.json"
+VERSIONS_URL = "https://testing.zephyrproject.org/daily_tests/versions.json"
+DATE_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
 
 
 def parse_args():
@@ -41,14 +45,12 @@ def parse_args():
 
 
 def get_versions():
-    data = None
-    fo = tempfile.NamedTemporaryFile()
-    if not os.path.exists('versions.json'):
-        url = 'https://testing.zephyrproject.org/daily_tests/versions.json'
-        urllib.request.urlretrieve(url, fo.name)
-    with open(fo.name, "r") as fp:
-        data = json.load(fp)
-    return data
+    if os.path.exists(VERSIONS_FILE):
+        with open(VERSIONS_FILE, "rb") as fp:
+            return json.loads(fp.read())
+    # Parse the HTTP response body in memory.
+    with urllib.request.urlopen(VERSIONS_URL) as response:
+        return json.loads(response.read())
 
 def handle_compat(item):
     item_compat = {}
@@ -72,7 +74,7 @@ def show_versions():
             if is_weekly:
                 wstr = "(marked for weekly testing)"
             if item_compat.get('date'):
-                pdate = datetime.strptime(item_compat['date'], '%Y-%m-%dT%H:%M:%S.%f')
+                pdate = datetime.strptime(item_compat['date'], DATE_FORMAT)
                 date = pdate.strftime("%b %d %Y %H:%M:%S")
                 datestr = f"published on {date}"
             print(f"- {item_compat['version']} {datestr} {wstr}")
@@ -102,13 +104,25 @@ def show_latest():
 
 def update(git_tree, is_weekly=False):
     g = Git(git_tree)
-    today = datetime.now().strftime('%Y-%m-%dT%H:%M:%S.%f')
-    version = g.describe()
+    today = datetime.now().strftime(DATE_FORMAT)
     published = False
-    data = get_versions()
+    # Fetch versions in the background while git describe runs. The
+    # thread is a daemon, so a describe failure exits straight away
+    # instead of waiting for the download to finish.
+    lookup = Future()
+
+    def fetch_versions():
+        try:
+            lookup.set_result(get_versions())
+        except BaseException as e:
+            lookup.set_exception(e)
+
+    threading.Thread(target=fetch_versions, daemon=True).start()
+    version = g.describe()
+    data = lookup.result()
 
-    found = list(filter(lambda item: (isinstance(item, dict) and
-                        item.get('version') == version) or item == version, data))
+    found = any((isinstance(item, dict) and item.get('version') == version)
+                or item == version for item in data)
     if found:
         published = True
         print("version already published")
@@ -116,13 +130,24 @@ def update(git_tree, is_weekly=False):
         print(f"New version {version}, adding to file...")
 
     if data and not published:
-        with open(VERSIONS_FILE, "w") as versions:
-            item = {}
-            item['version'] = version
-            item['date'] = today
-            item['weekly'] = is_weekly
-            data.append(item)
-            json.dump(data, versions)
+        item = {}
+        item['version'] = version
+        item['date'] = today
+        item['weekly'] = is_weekly
+        data.append(item)
+        # Write next to the target and rename over it, so an interrupted
+        # run never leaves a truncated versions.json behind.
+        tmp_name = f"{VERSIONS_FILE}.tmp"
+        try:
+            with open(tmp_name, "w") as versions:
+                versions.write(json.dumps(data))
+            if os.path.exists(VERSIONS_FILE):
+                shutil.copymode(VERSIONS_FILE, tmp_name)
+            os.replace(tmp_name, VERSIONS_FILE)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
 
 def main():
     global args